@@ -14,6 +14,7 @@
 import re
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from typing import Any, Dict, List, Optional, Union
 
 from markdown_it.rules_block import reference
@@ -181,7 +182,7 @@ class ValidationConfig:
         self._on_field_validation()
         self._ref_field_validation()
 
-    @property
+    @cached_property
     def get_validation_function(self) -> ValidationFunction:
         return ValidationFunction(self._validation_function)
 
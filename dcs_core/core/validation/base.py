@@ -14,10 +14,10 @@
 
 import datetime
 import json
-import sys
-import traceback
+import operator
+import re
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Union
+from typing import Callable, Optional, Tuple, Union
 
 from loguru import logger
 
@@ -28,13 +28,42 @@ from dcs_core.core.common.models.configuration import (
 from dcs_core.core.common.models.validation import (
     ConditionType,
     DeltaValidationInfo,
+    Threshold,
     ValidationFunction,
     ValidationInfo,
 )
 from dcs_core.core.datasource.manager import DataSource
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson silently converts integers outside the 64-bit range to floats, so
+# input with a run of 19 or more digits is left to json. This is deliberately
+# conservative: 19-digit values inside the u64 range, digits inside strings
+# and long float mantissas also match. A false positive only skips orjson
+# and costs speed, never correctness, so do not narrow it into a lossy path.
+_LONG_DIGIT_RUN = re.compile(r"\d{19,}")
+
+
+def _json_loads(value: str):
+    """
+    Parse JSON with orjson when it is installed. Input orjson rejects (NaN,
+    Infinity) or would parse lossily (integers wider than 64 bits) is left
+    to json.
+    """
+    if orjson is not None and not _LONG_DIGIT_RUN.search(value):
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(value)
+
 
 class ValidationIdentity:
+    __slots__ = ()
+
     @staticmethod
     def generate_identity(
         validation_function: ValidationFunction,
@@ -59,7 +88,54 @@ class ValidationIdentity:
             identifiers.append(validation_function.value)
         if validation_name:
             identifiers.append(validation_name)
-        return ".".join([str(p) for p in identifiers])
+        return ".".join(identifiers)
+
+
+# Maps each threshold condition to the comparison that fails it and the
+# reason reported when it does
+_THRESHOLD_CONDITIONS = {
+    ConditionType.GTE: (operator.lt, "Less than threshold value of {}"),
+    ConditionType.LTE: (operator.gt, "Greater than threshold value of {}"),
+    ConditionType.GT: (operator.le, "Less than or equal to threshold value of {}"),
+    ConditionType.LT: (
+        operator.ge,
+        "Greater than or equal to threshold value of {}",
+    ),
+    ConditionType.EQ: (operator.ne, "Not equal to the value of {}"),
+}
+
+
+def _build_threshold_validator(
+    threshold: Threshold,
+) -> Callable[[Union[float, int]], Tuple[bool, Optional[str]]]:
+    """
+    Build a validator for the conditions configured on a threshold
+    """
+    checks = []
+    for condition, value in threshold.__dict__.items():
+        if value is not None:
+            failed, reason = _THRESHOLD_CONDITIONS[condition]
+            checks.append((failed, value, reason.format(value)))
+
+    if len(checks) == 1:
+        ((failed, value, reason),) = checks
+
+        def _validate_single(metric_value) -> Tuple[bool, Optional[str]]:
+            if failed(metric_value, value):
+                return False, reason
+            return True, None
+
+        return _validate_single
+
+    checks = tuple(checks)
+
+    def _validate(metric_value) -> Tuple[bool, Optional[str]]:
+        for failed, value, reason in checks:
+            if failed(metric_value, value):
+                return False, reason
+        return True, None
+
+    return _validate
 
 
 class Validation(ABC):
@@ -67,6 +143,22 @@ class Validation(ABC):
     Validation is a class that represents a validation that is generated by a data source.
     """
 
+    __slots__ = (
+        "name",
+        "validation_config",
+        "data_source",
+        "dataset_name",
+        "field_name",
+        "query",
+        "threshold",
+        "where_filter",
+        "values",
+        "regex_pattern",
+        "_identity",
+        "_vfunc",
+        "_validate_threshold",
+    )
+
     def __init__(
         self,
         name: str,
@@ -85,96 +177,75 @@ class Validation(ABC):
         self.query = validation_config.query
 
         self.threshold = validation_config.threshold
+        self._validate_threshold = (
+            _build_threshold_validator(self.threshold)
+            if self.threshold is not None
+            else None
+        )
         self.where_filter = None
         self.values = None
         self.regex_pattern = validation_config.regex
 
         if validation_config.where:
             if data_source.language_support == DataSourceLanguageSupport.DSL_ES:
-                self.where_filter = json.loads(validation_config.where)
+                self.where_filter = _json_loads(validation_config.where)
             elif data_source.language_support == DataSourceLanguageSupport.SQL:
                 self.where_filter = validation_config.where
         if validation_config.values:
             if data_source.language_support == DataSourceLanguageSupport.SQL:
                 self.values = validation_config.values
 
-    def get_validation_identity(self) -> str:
-        return ValidationIdentity.generate_identity(
-            validation_function=self.validation_config.get_validation_function,
+        self._vfunc = validation_config.get_validation_function
+        self._identity = ValidationIdentity.generate_identity(
+            validation_function=self._vfunc,
             validation_name=self.name,
             data_source_name=self.data_source.data_source_name,
             dataset_name=self.dataset_name,
             field_name=self.field_name,
         )
 
-    def _validate_threshold(self, metric_value) -> Tuple[bool, Optional[str]]:
-        for operator, value in self.threshold.__dict__.items():
-            if value is not None:
-                if ConditionType.GTE == operator:
-                    if metric_value < value:
-                        return (
-                            False,
-                            f"Less than threshold value of {value}",
-                        )
-                elif ConditionType.LTE == operator:
-                    if metric_value > value:
-                        return (
-                            False,
-                            f"Greater than threshold value of {value}",
-                        )
-                elif ConditionType.GT == operator:
-                    if metric_value <= value:
-                        return (
-                            False,
-                            f"Less than or equal to threshold value of {value}",
-                        )
-                elif ConditionType.LT == operator:
-                    if metric_value >= value:
-                        return (
-                            False,
-                            f"Greater than or equal to threshold value of {value}",
-                        )
-                elif ConditionType.EQ == operator:
-                    if metric_value != value:
-                        return (
-                            False,
-                            f"Not equal to the value of {value}",
-                        )
-        return True, None
+    def get_validation_identity(self) -> str:
+        return self._identity
 
     @abstractmethod
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         pass
 
     def get_validation_info(self, **kwargs) -> Union[ValidationInfo, None]:
+        validate_threshold = self._validate_threshold
         try:
             metric_value = self._generate_metric_value(**kwargs)
-            tags = {
-                "name": self.name,
-            }
-
             value = ValidationInfo(
                 name=self.name,
-                identity=self.get_validation_identity(),
+                identity=self._identity,
                 data_source_name=self.data_source.data_source_name,
                 dataset=self.dataset_name,
-                validation_function=self.validation_config.get_validation_function,
+                validation_function=self._vfunc,
                 field=self.field_name,
                 value=metric_value,
                 timestamp=datetime.datetime.utcnow(),
-                tags=tags,
+                tags={
+                    "name": self.name,
+                },
             )
-            if self.threshold is not None:
-                value.is_valid, value.reason = self._validate_threshold(metric_value)
+            if validate_threshold is not None:
+                value.is_valid, value.reason = validate_threshold(metric_value)
 
             return value
         except Exception as e:
-            traceback.print_exc(file=sys.stdout)
-            logger.error(f"Failed to generate metric {self.name}: {str(e)}")
+            logger.opt(exception=True).error(
+                f"Failed to generate metric {self.name}: {str(e)}"
+            )
             return None
 
 
 class DeltaValidation(Validation, ABC):
+    __slots__ = (
+        "reference_data_source",
+        "reference_dataset_name",
+        "reference_field_name",
+    )
+
     def __init__(
         self,
         name: str,
@@ -196,21 +267,18 @@ class DeltaValidation(Validation, ABC):
         pass
 
     def get_validation_info(self, **kwargs) -> Union[ValidationInfo, None]:
+        validate_threshold = self._validate_threshold
         try:
             metric_value = self._generate_metric_value(**kwargs)
             reference_metric_value = self._generate_reference_metric_value(**kwargs)
             delta_value = abs(metric_value - reference_metric_value)
 
-            tags = {
-                "name": self.name,
-            }
-
             value = DeltaValidationInfo(
                 name=self.name,
-                identity=self.get_validation_identity(),
+                identity=self._identity,
                 data_source_name=self.data_source.data_source_name,
                 dataset=self.dataset_name,
-                validation_function=self.validation_config.get_validation_function,
+                validation_function=self._vfunc,
                 field=self.field_name,
                 value=delta_value,
                 source_value=metric_value,
@@ -218,13 +286,16 @@ class DeltaValidation(Validation, ABC):
                 reference_datasource_name=self.reference_data_source.data_source_name,
                 reference_dataset=self.reference_dataset_name,
                 timestamp=datetime.datetime.utcnow(),
-                tags=tags,
+                tags={
+                    "name": self.name,
+                },
             )
-            if self.threshold is not None:
-                value.is_valid, value.reason = self._validate_threshold(delta_value)
+            if validate_threshold is not None:
+                value.is_valid, value.reason = validate_threshold(delta_value)
 
             return value
         except Exception as e:
-            traceback.print_exc(file=sys.stdout)
-            logger.error(f"Failed to generate metric {self.name}: {str(e)}")
+            logger.opt(exception=True).error(
+                f"Failed to generate metric {self.name}: {str(e)}"
+            )
             return None
@@ -20,6 +20,8 @@ from dcs_core.core.validation.base import Validation
 
 
 class CountNullValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_null_count(
@@ -38,6 +40,8 @@ class CountNullValidation(Validation):
 
 
 class PercentageNullValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_null_percentage(
@@ -56,6 +60,8 @@ class PercentageNullValidation(Validation):
 
 
 class CountEmptyStringValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_empty_string_count(
@@ -74,6 +80,8 @@ class CountEmptyStringValidation(Validation):
 
 
 class PercentageEmptyStringValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_empty_string_percentage(
@@ -92,6 +100,8 @@ class PercentageEmptyStringValidation(Validation):
 
 
 class CountAllSpaceValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_all_space_count(
@@ -105,6 +115,8 @@ class CountAllSpaceValidation(Validation):
 
 
 class PercentageAllSpaceValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_all_space_count(
@@ -118,6 +130,8 @@ class PercentageAllSpaceValidation(Validation):
 
 
 class CountNullKeywordValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_null_keyword_count(
@@ -131,6 +145,8 @@ class CountNullKeywordValidation(Validation):
 
 
 class PercentageNullKeywordValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_null_keyword_count(
@@ -17,6 +17,8 @@ from dcs_core.core.validation.base import Validation
 
 
 class CustomSqlValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self):
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_custom_sql(query=self.query)
@@ -20,6 +20,8 @@ from dcs_core.core.validation.base import Validation
 
 
 class MinValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_min(
@@ -38,6 +40,8 @@ class MinValidation(Validation):
 
 
 class MaxValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_max(
@@ -56,6 +60,8 @@ class MaxValidation(Validation):
 
 
 class AvgValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_avg(
@@ -74,6 +80,8 @@ class AvgValidation(Validation):
 
 
 class SumValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_sum(
@@ -92,6 +100,8 @@ class SumValidation(Validation):
 
 
 class VarianceValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_variance(
@@ -110,6 +120,8 @@ class VarianceValidation(Validation):
 
 
 class StdDevValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_stddev(
@@ -128,6 +140,8 @@ class StdDevValidation(Validation):
 
 
 class Percentile20Validation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> float:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_percentile(
@@ -141,6 +155,8 @@ class Percentile20Validation(Validation):
 
 
 class Percentile40Validation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> float:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_percentile(
@@ -154,6 +170,8 @@ class Percentile40Validation(Validation):
 
 
 class Percentile60Validation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> float:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_percentile(
@@ -167,6 +185,8 @@ class Percentile60Validation(Validation):
 
 
 class Percentile80Validation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> float:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_percentile(
@@ -180,6 +200,8 @@ class Percentile80Validation(Validation):
 
 
 class Percentile90Validation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> float:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_percentile(
@@ -193,6 +215,8 @@ class Percentile90Validation(Validation):
 
 
 class CountZeroValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> int:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_zero_metric(
@@ -206,6 +230,8 @@ class CountZeroValidation(Validation):
 
 
 class PercentZeroValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> float:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_zero_metric(
@@ -219,6 +245,8 @@ class PercentZeroValidation(Validation):
 
 
 class CountNegativeValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> int:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_negative_metric(
@@ -232,6 +260,8 @@ class CountNegativeValidation(Validation):
 
 
 class PercentNegativeValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> float:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_negative_metric(
@@ -23,6 +23,8 @@ class CountDocumentsValidation(Validation):
     DocumentCountMetrics is a class that represents a metric that is generated by a data source.
     """
 
+    __slots__ = ()
+
     def _generate_metric_value(self):
         if isinstance(self.data_source, SearchIndexDataSource):
             return self.data_source.query_get_document_count(
@@ -39,6 +41,8 @@ class CountRowValidation(Validation):
     RowCountMetrics is a class that represents a metric that is generated by a data source.
     """
 
+    __slots__ = ()
+
     def _generate_metric_value(self):
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_row_count(
@@ -54,6 +58,8 @@ class DeltaCountRowValidation(DeltaValidation):
     RowCountMetrics is a class that represents a metric that is generated by a data source.
     """
 
+    __slots__ = ()
+
     def _generate_reference_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.reference_data_source, SQLDataSource):
             return self.reference_data_source.query_get_row_count(
@@ -78,6 +84,8 @@ class FreshnessValueMetric(Validation):
     FreshnessMetric is a class that represents a metric that is generated by a data source.
     """
 
+    __slots__ = ()
+
     def _generate_metric_value(self):
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_time_diff(
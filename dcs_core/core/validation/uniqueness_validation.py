@@ -20,6 +20,8 @@ from dcs_core.core.validation.base import Validation
 
 
 class CountDuplicateValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_duplicate_count(
@@ -38,6 +40,8 @@ class CountDuplicateValidation(Validation):
 
 
 class CountDistinctValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_distinct_count(
@@ -20,6 +20,8 @@ from dcs_core.core.validation.base import Validation
 
 
 class CountUUIDValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -36,6 +38,8 @@ class CountUUIDValidation(Validation):
 
 
 class PercentUUIDValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -52,6 +56,8 @@ class PercentUUIDValidation(Validation):
 
 
 class CountInvalidValues(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if self.values is None:
             raise ValueError("Values are required for count_invalid_values validation")
@@ -73,6 +79,8 @@ class CountInvalidValues(Validation):
 
 
 class PercentInvalidValues(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if self.values is None:
             raise ValueError(
@@ -96,6 +104,8 @@ class PercentInvalidValues(Validation):
 
 
 class CountValidValues(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if self.values is None:
             raise ValueError("Values are required for count_valid_values validation")
@@ -117,6 +127,8 @@ class CountValidValues(Validation):
 
 
 class PercentValidValues(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if self.values is None:
             raise ValueError("Values are required for percent_valid_values validation")
@@ -138,6 +150,8 @@ class PercentValidValues(Validation):
 
 
 class CountInvalidRegex(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if self.regex_pattern is None:
             raise ValueError(
@@ -161,6 +175,8 @@ class CountInvalidRegex(Validation):
 
 
 class PercentInvalidRegex(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if self.regex_pattern is None:
             raise ValueError(
@@ -184,6 +200,8 @@ class PercentInvalidRegex(Validation):
 
 
 class CountValidRegex(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if self.regex_pattern is None:
             raise ValueError(
@@ -207,6 +225,8 @@ class CountValidRegex(Validation):
 
 
 class PercentValidRegex(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if self.regex_pattern is None:
             raise ValueError(
@@ -230,6 +250,8 @@ class PercentValidRegex(Validation):
 
 
 class CountUSAPhoneValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -252,6 +274,8 @@ class CountUSAPhoneValidation(Validation):
 
 
 class PercentUSAPhoneValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -274,6 +298,8 @@ class PercentUSAPhoneValidation(Validation):
 
 
 class CountEmailValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -290,6 +316,8 @@ class CountEmailValidation(Validation):
 
 
 class PercentEmailValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -306,6 +334,8 @@ class PercentEmailValidation(Validation):
 
 
 class StringLengthMaxValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_string_length_metric(
@@ -321,6 +351,8 @@ class StringLengthMaxValidation(Validation):
 
 
 class StringLengthMinValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_string_length_metric(
@@ -336,6 +368,8 @@ class StringLengthMinValidation(Validation):
 
 
 class StringLengthAverageValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_get_string_length_metric(
@@ -351,6 +385,8 @@ class StringLengthAverageValidation(Validation):
 
 
 class CountUSAZipCodeValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -367,6 +403,8 @@ class CountUSAZipCodeValidation(Validation):
 
 
 class PercentUSAZipCodeValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -383,6 +421,8 @@ class PercentUSAZipCodeValidation(Validation):
 
 
 class CountUSAStateCodeValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             (
@@ -401,6 +441,8 @@ class CountUSAStateCodeValidation(Validation):
 
 
 class PercentUSAStateCodeValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             (
@@ -419,6 +461,8 @@ class PercentUSAStateCodeValidation(Validation):
 
 
 class CountLatitudeValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_geolocation_metric(
@@ -432,6 +476,8 @@ class CountLatitudeValidation(Validation):
 
 
 class PercentLatitudeValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_geolocation_metric(
@@ -447,6 +493,8 @@ class PercentLatitudeValidation(Validation):
 
 
 class CountLongitudeValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_geolocation_metric(
@@ -462,6 +510,8 @@ class CountLongitudeValidation(Validation):
 
 
 class PercentLongitudeValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             return self.data_source.query_geolocation_metric(
@@ -477,6 +527,8 @@ class PercentLongitudeValidation(Validation):
 
 
 class CountSSNValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -493,6 +545,8 @@ class CountSSNValidation(Validation):
 
 
 class PercentSSNValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -509,6 +563,8 @@ class PercentSSNValidation(Validation):
 
 
 class CountSEDOLValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -525,6 +581,8 @@ class CountSEDOLValidation(Validation):
 
 
 class PercentSEDOLValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -541,6 +599,8 @@ class PercentSEDOLValidation(Validation):
 
 
 class CountCUSIPValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -557,6 +617,8 @@ class CountCUSIPValidation(Validation):
 
 
 class PercentCUSIPValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -573,6 +635,8 @@ class PercentCUSIPValidation(Validation):
 
 
 class CountLEIValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -589,6 +653,8 @@ class CountLEIValidation(Validation):
 
 
 class PercentLEIValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -605,6 +671,8 @@ class PercentLEIValidation(Validation):
 
 
 class CountFIGIValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -621,6 +689,8 @@ class CountFIGIValidation(Validation):
 
 
 class PercentFIGIValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -637,6 +707,8 @@ class PercentFIGIValidation(Validation):
 
 
 class CountISINValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -653,6 +725,8 @@ class CountISINValidation(Validation):
 
 
 class PercentISINValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -669,6 +743,8 @@ class PercentISINValidation(Validation):
 
 
 class CountPermIDValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -685,6 +761,8 @@ class CountPermIDValidation(Validation):
 
 
 class PercentPermIDValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_count = self.data_source.query_string_pattern_validity(
@@ -701,6 +779,8 @@ class PercentPermIDValidation(Validation):
 
 
 class CountTimeStampValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_row_count = self.data_source.query_timestamp_metric(
@@ -718,6 +798,8 @@ class CountTimeStampValidation(Validation):
 
 
 class PercentTimeStampValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             valid_count, total_row_count = self.data_source.query_timestamp_metric(
@@ -739,6 +821,8 @@ class PercentTimeStampValidation(Validation):
 
 
 class CountNotInFutureValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             (
@@ -759,6 +843,8 @@ class CountNotInFutureValidation(Validation):
 
 
 class PercentNotInFutureValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             (
@@ -783,6 +869,8 @@ class PercentNotInFutureValidation(Validation):
 
 
 class CountDateNotInFutureValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             (
@@ -803,6 +891,8 @@ class CountDateNotInFutureValidation(Validation):
 
 
 class PercentDateNotInFutureValidation(Validation):
+    __slots__ = ()
+
     def _generate_metric_value(self, **kwargs) -> Union[float, int]:
         if isinstance(self.data_source, SQLDataSource):
             (
@@ -0,0 +1,453 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import math
+from unittest.mock import Mock
+
+from dcs_core.core.common.models.configuration import (
+    DataSourceLanguageSupport,
+    ValidationConfig,
+)
+from dcs_core.core.common.models.validation import Threshold, ValidationFunction
+from dcs_core.core.datasource.search_datasource import SearchIndexDataSource
+from dcs_core.core.datasource.sql_datasource import SQLDataSource
+from dcs_core.core.validation import base as validation_base
+from dcs_core.core.validation.numeric_validation import MinValidation
+
+
+class TestMinValidation:
+    def test_should_return_min_validation_info_without_threshold(self):
+        mock_data_source = Mock(spec=SQLDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.SQL
+        mock_data_source.query_get_min.return_value = 13
+
+        validation = MinValidation(
+            name="min_validation_test",
+            validation_config=ValidationConfig(
+                name="min_validation_test",
+                on="min(age)",
+            ),
+            data_source=mock_data_source,
+            dataset_name="numeric_validation_test",
+            field_name="age",
+        )
+        validation_info = validation.get_validation_info()
+        assert validation_info.value == 13
+        assert validation_info.validation_function == ValidationFunction.MIN
+        assert (
+            validation_info.identity
+            == "test_data_source.numeric_validation_test.age.min.min_validation_test"
+        )
+        assert validation_info.is_valid is None
+        assert validation_info.reason is None
+        assert validation_info.timestamp.tzinfo is None
+
+    def test_should_not_share_tags_between_validation_infos(self):
+        mock_data_source = Mock(spec=SQLDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.SQL
+        mock_data_source.query_get_min.return_value = 13
+
+        validation = MinValidation(
+            name="min_validation_test",
+            validation_config=ValidationConfig(
+                name="min_validation_test",
+                on="min(age)",
+            ),
+            data_source=mock_data_source,
+            dataset_name="numeric_validation_test",
+            field_name="age",
+        )
+        first_validation_info = validation.get_validation_info()
+        second_validation_info = validation.get_validation_info()
+        assert first_validation_info.tags is not second_validation_info.tags
+
+        first_validation_info.tags["run"] = "first"
+        assert second_validation_info.tags == {"name": "min_validation_test"}
+
+    def test_should_not_have_instance_dict(self):
+        mock_data_source = Mock(spec=SQLDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.SQL
+
+        validation = MinValidation(
+            name="min_validation_test",
+            validation_config=ValidationConfig(
+                name="min_validation_test",
+                on="min(age)",
+            ),
+            data_source=mock_data_source,
+            dataset_name="numeric_validation_test",
+            field_name="age",
+        )
+        assert not hasattr(validation, "__dict__")
+
+    def test_should_validate_min_value_with_gt_threshold(self):
+        mock_data_source = Mock(spec=SQLDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.SQL
+        mock_data_source.query_get_min.return_value = 13
+
+        validation = MinValidation(
+            name="min_validation_test",
+            validation_config=ValidationConfig(
+                name="min_validation_test",
+                on="min(age)",
+                threshold=Threshold(gt=100),
+            ),
+            data_source=mock_data_source,
+            dataset_name="numeric_validation_test",
+            field_name="age",
+        )
+        validation_info = validation.get_validation_info()
+        assert validation_info.value == 13
+        assert validation_info.is_valid is False
+        assert validation_info.reason == "Less than or equal to threshold value of 100"
+
+    def test_should_validate_min_value_with_passing_gte_threshold(self):
+        mock_data_source = Mock(spec=SQLDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.SQL
+        mock_data_source.query_get_min.return_value = 13
+
+        validation = MinValidation(
+            name="min_validation_test",
+            validation_config=ValidationConfig(
+                name="min_validation_test",
+                on="min(age)",
+                threshold=Threshold(gte=13),
+            ),
+            data_source=mock_data_source,
+            dataset_name="numeric_validation_test",
+            field_name="age",
+        )
+        validation_info = validation.get_validation_info()
+        assert validation_info.value == 13
+        assert validation_info.is_valid is True
+        assert validation_info.reason == None
+
+    def test_should_validate_min_value_with_gte_threshold(self):
+        mock_data_source = Mock(spec=SQLDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.SQL
+        mock_data_source.query_get_min.return_value = 13
+
+        validation = MinValidation(
+            name="min_validation_test",
+            validation_config=ValidationConfig(
+                name="min_validation_test",
+                on="min(age)",
+                threshold=Threshold(gte=100),
+            ),
+            data_source=mock_data_source,
+            dataset_name="numeric_validation_test",
+            field_name="age",
+        )
+        validation_info = validation.get_validation_info()
+        assert validation_info.value == 13
+        assert validation_info.is_valid is False
+        assert validation_info.reason == "Less than threshold value of 100"
+
+    def test_should_validate_min_value_with_lt_threshold(self):
+        mock_data_source = Mock(spec=SQLDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.SQL
+        mock_data_source.query_get_min.return_value = 13
+
+        validation = MinValidation(
+            name="min_validation_test",
+            validation_config=ValidationConfig(
+                name="min_validation_test",
+                on="min(age)",
+                threshold=Threshold(lt=13),
+            ),
+            data_source=mock_data_source,
+            dataset_name="numeric_validation_test",
+            field_name="age",
+        )
+        validation_info = validation.get_validation_info()
+        assert validation_info.value == 13
+        assert validation_info.is_valid is False
+        assert (
+            validation_info.reason == "Greater than or equal to threshold value of 13"
+        )
+
+    def test_should_validate_min_value_with_lte_threshold(self):
+        mock_data_source = Mock(spec=SQLDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.SQL
+        mock_data_source.query_get_min.return_value = 13
+
+        validation = MinValidation(
+            name="min_validation_test",
+            validation_config=ValidationConfig(
+                name="min_validation_test",
+                on="min(age)",
+                threshold=Threshold(lte=10),
+            ),
+            data_source=mock_data_source,
+            dataset_name="numeric_validation_test",
+            field_name="age",
+        )
+        validation_info = validation.get_validation_info()
+        assert validation_info.value == 13
+        assert validation_info.is_valid is False
+        assert validation_info.reason == "Greater than threshold value of 10"
+
+    def test_should_validate_min_value_with_passing_eq_threshold(self):
+        mock_data_source = Mock(spec=SQLDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.SQL
+        mock_data_source.query_get_min.return_value = 13
+
+        validation = MinValidation(
+            name="min_validation_test",
+            validation_config=ValidationConfig(
+                name="min_validation_test",
+                on="min(age)",
+                threshold=Threshold(eq=13),
+            ),
+            data_source=mock_data_source,
+            dataset_name="numeric_validation_test",
+            field_name="age",
+        )
+        validation_info = validation.get_validation_info()
+        assert validation_info.value == 13
+        assert validation_info.is_valid is True
+        assert validation_info.reason == None
+
+    def test_should_validate_min_value_with_eq_threshold(self):
+        mock_data_source = Mock(spec=SQLDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.SQL
+        mock_data_source.query_get_min.return_value = 13
+
+        validation = MinValidation(
+            name="min_validation_test",
+            validation_config=ValidationConfig(
+                name="min_validation_test",
+                on="min(age)",
+                threshold=Threshold(eq=100),
+            ),
+            data_source=mock_data_source,
+            dataset_name="numeric_validation_test",
+            field_name="age",
+        )
+        validation_info = validation.get_validation_info()
+        assert validation_info.value == 13
+        assert validation_info.is_valid is False
+        assert validation_info.reason == "Not equal to the value of 100"
+
+    def test_should_validate_min_value_with_range_threshold(self):
+        mock_data_source = Mock(spec=SQLDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.SQL
+        mock_data_source.query_get_min.return_value = 13
+
+        validation = MinValidation(
+            name="min_validation_test",
+            validation_config=ValidationConfig(
+                name="min_validation_test",
+                on="min(age)",
+                threshold=Threshold(gte=10, lte=20),
+            ),
+            data_source=mock_data_source,
+            dataset_name="numeric_validation_test",
+            field_name="age",
+        )
+        validation_info = validation.get_validation_info()
+        assert validation_info.value == 13
+        assert validation_info.is_valid is True
+        assert validation_info.reason == None
+
+    def test_should_validate_min_value_with_range_below_threshold(self):
+        mock_data_source = Mock(spec=SQLDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.SQL
+        mock_data_source.query_get_min.return_value = 13
+
+        validation = MinValidation(
+            name="min_validation_test",
+            validation_config=ValidationConfig(
+                name="min_validation_test",
+                on="min(age)",
+                threshold=Threshold(gte=20, lte=30),
+            ),
+            data_source=mock_data_source,
+            dataset_name="numeric_validation_test",
+            field_name="age",
+        )
+        validation_info = validation.get_validation_info()
+        assert validation_info.value == 13
+        assert validation_info.is_valid is False
+        assert validation_info.reason == "Less than threshold value of 20"
+
+    def test_should_validate_min_value_with_range_above_threshold(self):
+        mock_data_source = Mock(spec=SQLDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.SQL
+        mock_data_source.query_get_min.return_value = 13
+
+        validation = MinValidation(
+            name="min_validation_test",
+            validation_config=ValidationConfig(
+                name="min_validation_test",
+                on="min(age)",
+                threshold=Threshold(gte=1, lte=10),
+            ),
+            data_source=mock_data_source,
+            dataset_name="numeric_validation_test",
+            field_name="age",
+        )
+        validation_info = validation.get_validation_info()
+        assert validation_info.value == 13
+        assert validation_info.is_valid is False
+        assert validation_info.reason == "Greater than threshold value of 10"
+
+    def test_should_parse_where_filter_for_search_data_source(self):
+        mock_data_source = Mock(spec=SearchIndexDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.DSL_ES
+        mock_data_source.query_get_min.return_value = 13
+
+        validation = MinValidation(
+            name="min_validation_test",
+            validation_config=ValidationConfig(
+                name="min_validation_test",
+                on="min(age)",
+                where='{"range": {"age": {"gte": 30}}}',
+            ),
+            data_source=mock_data_source,
+            dataset_name="numeric_validation_test",
+            field_name="age",
+        )
+        assert validation.where_filter == {"range": {"age": {"gte": 30}}}
+        assert validation.get_validation_info().value == 13
+        mock_data_source.query_get_min.assert_called_once_with(
+            index_name="numeric_validation_test",
+            field="age",
+            filters={"range": {"age": {"gte": 30}}},
+        )
+
+    def test_should_parse_where_filter_with_orjson(self, monkeypatch):
+        mock_orjson = Mock(spec=["loads", "JSONDecodeError"])
+        mock_orjson.JSONDecodeError = ValueError
+        mock_orjson.loads.return_value = {"range": {"age": {"gte": 30}}}
+        monkeypatch.setattr(validation_base, "orjson", mock_orjson)
+        mock_data_source = Mock(spec=SearchIndexDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.DSL_ES
+
+        validation = MinValidation(
+            name="min_validation_test",
+            validation_config=ValidationConfig(
+                name="min_validation_test",
+                on="min(age)",
+                where='{"range": {"age": {"gte": 30}}}',
+            ),
+            data_source=mock_data_source,
+            dataset_name="numeric_validation_test",
+            field_name="age",
+        )
+        mock_orjson.loads.assert_called_once_with('{"range": {"age": {"gte": 30}}}')
+        assert validation.where_filter == {"range": {"age": {"gte": 30}}}
+
+    def test_should_parse_where_filter_with_nan_rejected_by_orjson(self, monkeypatch):
+        mock_orjson = Mock(spec=["loads", "JSONDecodeError"])
+        mock_orjson.JSONDecodeError = ValueError
+        mock_orjson.loads.side_effect = ValueError("NaN is not valid JSON")
+        monkeypatch.setattr(validation_base, "orjson", mock_orjson)
+        mock_data_source = Mock(spec=SearchIndexDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.DSL_ES
+
+        validation = MinValidation(
+            name="min_validation_test",
+            validation_config=ValidationConfig(
+                name="min_validation_test",
+                on="min(age)",
+                where='{"range": {"age": {"gte": NaN}}}',
+            ),
+            data_source=mock_data_source,
+            dataset_name="numeric_validation_test",
+            field_name="age",
+        )
+        mock_orjson.loads.assert_called_once()
+        assert math.isnan(validation.where_filter["range"]["age"]["gte"])
+
+    def test_should_parse_where_filter_with_integer_wider_than_64_bits(
+        self, monkeypatch
+    ):
+        mock_orjson = Mock(spec=["loads", "JSONDecodeError"])
+        mock_orjson.JSONDecodeError = ValueError
+        mock_orjson.loads.return_value = {"term": {"id": 1.2345678901234568e29}}
+        monkeypatch.setattr(validation_base, "orjson", mock_orjson)
+        mock_data_source = Mock(spec=SearchIndexDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.DSL_ES
+
+        validation = MinValidation(
+            name="min_validation_test",
+            validation_config=ValidationConfig(
+                name="min_validation_test",
+                on="min(age)",
+                where='{"term": {"id": 123456789012345678901234567890}}',
+            ),
+            data_source=mock_data_source,
+            dataset_name="numeric_validation_test",
+            field_name="age",
+        )
+        mock_orjson.loads.assert_not_called()
+        assert validation.where_filter == {
+            "term": {"id": 123456789012345678901234567890}
+        }
+
+    def test_should_parse_where_filter_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(validation_base, "orjson", None)
+
+        mock_data_source = Mock(spec=SearchIndexDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.DSL_ES
+
+        validation = MinValidation(
+            name="min_validation_test",
+            validation_config=ValidationConfig(
+                name="min_validation_test",
+                on="min(age)",
+                where='{"range": {"age": {"gte": 30}}}',
+            ),
+            data_source=mock_data_source,
+            dataset_name="numeric_validation_test",
+            field_name="age",
+        )
+        assert validation.where_filter == {"range": {"age": {"gte": 30}}}
+
+    def test_should_return_none_when_metric_generation_fails(self):
+        mock_data_source = Mock(spec=SQLDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.SQL
+        mock_data_source.query_get_min.side_effect = Exception("field not found")
+
+        validation = MinValidation(
+            name="min_validation_test",
+            validation_config=ValidationConfig(
+                name="min_validation_test",
+                on="min(age)",
+                threshold=Threshold(gt=100),
+            ),
+            data_source=mock_data_source,
+            dataset_name="numeric_validation_test",
+            field_name="age",
+        )
+        assert validation.get_validation_info() is None
@@ -0,0 +1,87 @@
+#  Copyright 2022-present, the Waterdip Labs Pvt. Ltd.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from unittest.mock import Mock
+
+from dcs_core.core.common.models.configuration import (
+    DataSourceLanguageSupport,
+    ValidationConfig,
+)
+from dcs_core.core.common.models.validation import Threshold, ValidationFunction
+from dcs_core.core.datasource.sql_datasource import SQLDataSource
+from dcs_core.core.validation.reliability_validation import DeltaCountRowValidation
+
+
+class TestDeltaCountRowValidation:
+    def test_should_validate_delta_row_count_with_threshold(self):
+        mock_data_source = Mock(spec=SQLDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.SQL
+        mock_data_source.query_get_row_count.return_value = 100
+
+        mock_reference_data_source = Mock(spec=SQLDataSource)
+        mock_reference_data_source.data_source_name = "test_reference_data_source"
+        mock_reference_data_source.language_support = DataSourceLanguageSupport.SQL
+        mock_reference_data_source.query_get_row_count.return_value = 90
+
+        validation = DeltaCountRowValidation(
+            name="delta_count_rows_test",
+            validation_config=ValidationConfig(
+                name="delta_count_rows_test",
+                on="delta count_rows",
+                ref="test_reference_data_source.reference_table",
+                threshold=Threshold(lte=5),
+            ),
+            data_source=mock_data_source,
+            dataset_name="source_table",
+            reference_data_source=mock_reference_data_source,
+            reference_dataset_name="reference_table",
+        )
+        validation_info = validation.get_validation_info()
+        assert (
+            validation_info.validation_function == ValidationFunction.DELTA_COUNT_ROWS
+        )
+        assert validation_info.value == 10
+        assert validation_info.source_value == 100
+        assert validation_info.reference_value == 90
+        assert validation_info.is_valid is False
+        assert validation_info.reason == "Greater than threshold value of 5"
+
+    def test_should_validate_delta_row_count_within_threshold(self):
+        mock_data_source = Mock(spec=SQLDataSource)
+        mock_data_source.data_source_name = "test_data_source"
+        mock_data_source.language_support = DataSourceLanguageSupport.SQL
+        mock_data_source.query_get_row_count.return_value = 100
+
+        mock_reference_data_source = Mock(spec=SQLDataSource)
+        mock_reference_data_source.data_source_name = "test_reference_data_source"
+        mock_reference_data_source.language_support = DataSourceLanguageSupport.SQL
+        mock_reference_data_source.query_get_row_count.return_value = 98
+
+        validation = DeltaCountRowValidation(
+            name="delta_count_rows_test",
+            validation_config=ValidationConfig(
+                name="delta_count_rows_test",
+                on="delta count_rows",
+                ref="test_reference_data_source.reference_table",
+                threshold=Threshold(lte=5),
+            ),
+            data_source=mock_data_source,
+            dataset_name="source_table",
+            reference_data_source=mock_reference_data_source,
+            reference_dataset_name="reference_table",
+        )
+        validation_info = validation.get_validation_info()
+        assert validation_info.value == 2
+        assert validation_info.is_valid is True
+        assert validation_info.reason is None